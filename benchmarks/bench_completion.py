@@ -0,0 +1,69 @@
+"""Check that completion stays within the per-keystroke budget.
+
+Builds a CompletionIndex over a WordNet-sized vocabulary (the wordfreq top
+list, so no WordNet download is needed) and times complete() for every
+prefix of a sample of words, with and without the infix and fuzzy stages.
+Exits non-zero if the 99th percentile of any mode exceeds KEYSTROKE_BUDGET.
+The index build is timed separately and not held to the budget: the shell
+builds it in a background thread and completes no words until it is ready.
+
+    python benchmarks/bench_completion.py [--words N] [--queries N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+
+from wordfreq import top_n_list
+
+from vocab.completer import KEYSTROKE_BUDGET, CompletionIndex
+from vocab.sources.frequency import bulk_frequency
+
+MODES = {
+    "prefix": {},
+    "infix": {"infix": True},
+    "fuzzy": {"fuzzy": True},
+    "all": {"infix": True, "fuzzy": True},
+}
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    p.add_argument("--words", type=int, default=150_000, help="Vocabulary size")
+    p.add_argument("--queries", type=int, default=500, help="Words to type out prefix by prefix")
+    p.add_argument("--seed", type=int, default=0)
+    args = p.parse_args()
+
+    vocab = [w for w in top_n_list("en", args.words) if w.isalpha()]
+    start = time.perf_counter()
+    index = CompletionIndex(vocab, scores=bulk_frequency)
+    index._gram_index()  # built ahead of the first keystroke, as WordCompleter does
+    print(f"indexed {len(index)} words in {time.perf_counter() - start:.2f}s")
+
+    sample = random.Random(args.seed).sample(vocab, min(args.queries, len(vocab)))
+    queries = [w[:i] for w in sample for i in range(2, len(w) + 1)]
+
+    over = False
+    for name, options in MODES.items():
+        times = []
+        for q in queries:
+            t = time.perf_counter()
+            index.complete(q, **options)
+            times.append(time.perf_counter() - t)
+        times.sort()
+        p50 = times[len(times) // 2]
+        p99 = times[int(len(times) * 0.99)]
+        ok = p99 <= KEYSTROKE_BUDGET
+        over |= not ok
+        print(
+            f"{name:>6}: {len(times)} queries  p50 {p50 * 1e3:.2f}ms  p99 {p99 * 1e3:.2f}ms  "
+            f"max {times[-1] * 1e3:.2f}ms  {'ok' if ok else 'OVER BUDGET'}"
+        )
+    sys.exit(1 if over else 0)
+
+
+if __name__ == "__main__":
+    main()
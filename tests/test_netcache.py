@@ -0,0 +1,147 @@
+"""Network cache tier against local stand-in servers."""
+
+from __future__ import annotations
+
+import socketserver
+import threading
+
+import pytest
+
+from vocab.cache import LayeredCache, MemoryCache
+from vocab.netcache import CacheServer, HttpCache, RedisCache
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    """Just enough RESP for the commands RedisCache sends."""
+
+    def handle(self) -> None:
+        server: RespServer = self.server
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            args = []
+            for _ in range(int(line[1:])):
+                n = int(self.rfile.readline()[1:])
+                args.append(self.rfile.read(n + 2)[:-2].decode())
+            server.commands.append(args)
+            cmd = args[0]
+            if cmd == "MGET":
+                out = b"*%d\r\n" % (len(args) - 1)
+                for key in args[1:]:
+                    value = server.store.get(key)
+                    out += b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value.encode())
+                self.wfile.write(out)
+            elif cmd == "SET":
+                server.store[args[1]] = args[2]
+                self.wfile.write(b"+OK\r\n")
+            elif cmd in ("AUTH", "SELECT"):
+                self.wfile.write(b"+OK\r\n")
+            else:
+                self.wfile.write(b"-ERR unknown command\r\n")
+
+
+class RespServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+        self.commands: list[list[str]] = []
+        super().__init__(("127.0.0.1", 0), _RespHandler)
+
+    def count(self, cmd: str) -> int:
+        return sum(1 for args in self.commands if args[0] == cmd)
+
+
+@pytest.fixture
+def resp_server():
+    server = RespServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def redis(resp_server):
+    cache = RedisCache(port=resp_server.server_address[1], batch_size=2)
+    yield cache
+    cache.close()
+
+
+def test_writes_are_buffered_and_sent_in_batches(redis, resp_server):
+    redis.set("alpha", {"word": "alpha"})
+    assert resp_server.count("SET") == 0
+    # Buffered entries are readable before they are sent
+    assert redis.get("alpha") == {"word": "alpha"}
+    redis.set("beta", {"word": "beta"})
+    assert resp_server.count("SET") == 2
+    assert set(resp_server.store) == {"vocab:alpha", "vocab:beta"}
+
+
+def test_close_flushes_pending_writes(redis, resp_server):
+    redis.set("alpha", {"word": "alpha"})
+    redis.close()
+    assert "vocab:alpha" in resp_server.store
+
+
+def test_get_many_is_one_round_trip(redis, resp_server):
+    resp_server.store["vocab:alpha"] = '{"word": "alpha"}'
+    assert redis.get_many(["alpha", "beta", "gamma"]) == {"alpha": {"word": "alpha"}}
+    assert resp_server.count("MGET") == 1
+
+
+def test_misses_are_remembered_until_written(redis, resp_server):
+    assert redis.get_many(["alpha", "beta"]) == {}
+    assert redis.get("alpha") is None
+    assert resp_server.count("MGET") == 1
+    redis.set("alpha", {"word": "alpha"})
+    redis.flush()
+    assert redis.get("alpha") == {"word": "alpha"}
+
+
+def test_layered_hits_fill_upper_layers(redis, resp_server):
+    resp_server.store["vocab:alpha"] = '{"word": "alpha"}'
+    memory = MemoryCache()
+    layered = LayeredCache([memory, redis])
+    assert layered.get_many(["alpha", "beta"]) == {"alpha": {"word": "alpha"}}
+    assert memory.get("alpha") == {"word": "alpha"}
+    assert layered.get("alpha") == {"word": "alpha"}
+    assert layered.get("beta") is None
+    assert resp_server.count("MGET") == 1
+
+
+def test_unreachable_server_is_skipped(resp_server, caplog):
+    port = resp_server.server_address[1]
+    resp_server.shutdown()
+    resp_server.server_close()
+    cache = RedisCache(port=port, batch_size=1)
+    calls = []
+    read = cache._read_batch
+    cache._read_batch = lambda keys: calls.append(keys) or read(keys)
+    assert cache.get("alpha") is None
+    assert cache.get("beta") is None
+    assert len(calls) == 1
+    assert "shared cache unavailable" in caplog.text
+    # Writes while the server is down are dropped, not raised
+    cache.set("alpha", {"word": "alpha"})
+    cache.close()
+
+
+def test_http_cache_round_trip():
+    backend = MemoryCache()
+    server = CacheServer(("127.0.0.1", 0), backend)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = HttpCache(f"http://127.0.0.1:{server.server_address[1]}", batch_size=2)
+        client.set_many({"alpha": {"word": "alpha"}, "beta": {"word": "beta"}})
+        assert backend.get("alpha") == {"word": "alpha"}
+
+        other = HttpCache(f"http://127.0.0.1:{server.server_address[1]}")
+        assert other.get("alpha") == {"word": "alpha"}
+        assert other.get_many(["beta", "gamma"]) == {"beta": {"word": "beta"}}
+        assert other.get("gamma") is None
+    finally:
+        server.shutdown()
+        server.server_close()
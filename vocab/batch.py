@@ -0,0 +1,190 @@
+"""Resumable batch lookups with an append-only checkpoint journal."""
+
+from __future__ import annotations
+
+import functools
+import json
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeRemainingColumn
+
+from vocab.core import WordResult
+from vocab.formatter import format_result
+
+OK = "ok"
+FAILED = "fail"
+PREFETCH_CHUNK = 256
+
+
+def journal_path(output: Path) -> Path:
+    return output.with_name(output.name + ".journal")
+
+
+def read_journal(path: Path) -> dict[str, str]:
+    """Return the latest status per word. A torn last line is ignored."""
+    status: dict[str, str] = {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                state, _, word = line.rstrip("\n").partition("\t")
+                if state in (OK, FAILED) and word:
+                    status[word] = state
+    except FileNotFoundError:
+        pass
+    return status
+
+
+def iter_lookups(
+    words: list[str],
+    lookup: Callable[[str], WordResult],
+    jobs: int = 1,
+    prefetch: Callable[[list[str]], None] | None = None,
+) -> Iterator[tuple[str, WordResult | Exception]]:
+    """Yield (word, result or raised exception) in input order.
+
+    With ``jobs`` > 1 up to that many lookups are in flight at once, so their
+    network waits overlap and, with :mod:`vocab.workers` started, their CPU
+    stages spread over the worker processes.
+    """
+
+    def call(word: str) -> WordResult | Exception:
+        try:
+            return lookup(word)
+        except Exception as e:
+            return e
+
+    def maybe_prefetch(i: int) -> None:
+        if prefetch and i % PREFETCH_CHUNK == 0:
+            prefetch(words[i:i + PREFETCH_CHUNK])
+
+    if jobs <= 1:
+        for i, word in enumerate(words):
+            maybe_prefetch(i)
+            yield word, call(word)
+        return
+
+    pool = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="vocab-batch")
+    try:
+        window: deque = deque()
+        for i, word in enumerate(words):
+            maybe_prefetch(i)
+            window.append((word, pool.submit(call, word)))
+            if len(window) >= 2 * jobs:
+                w, future = window.popleft()
+                yield w, future.result()
+        while window:
+            w, future = window.popleft()
+            yield w, future.result()
+    finally:
+        # On interruption, drop queued lookups instead of finishing the window
+        pool.shutdown(cancel_futures=True)
+
+
+def _failed(result: WordResult) -> bool:
+    """A lookup failed if one of its sources raised; finding nothing is a result."""
+    return bool(result.failed) or (result.base_result is not None and _failed(result.base_result))
+
+
+def run_batch(
+    words: list[str],
+    output: Path,
+    lookup: Callable[..., WordResult],
+    json_output: bool = False,
+    brief: bool = False,
+    console: Console | None = None,
+    sections: list[str] | None = None,
+    prefetch: Callable[[list[str]], None] | None = None,
+    jobs: int = 1,
+) -> list[str]:
+    """Look up words into output, skipping words the journal marks done.
+
+    Results are appended to output (JSON lines with ``json_output``, otherwise
+    plain rendered text) and each word is journaled only after its result is
+    flushed, so an interrupted job resumes where it stopped; at worst the word
+    in flight at the interruption is written twice. Words whose lookup raised
+    or hit a failing source are retried once at the end with
+    ``lookup(word, no_cache=True)``, so nothing cached by the first attempt is
+    read back; words that simply have no data are written like any other.
+    ``prefetch`` is called with each upcoming chunk of words
+    so a layered cache can read them in one round trip, and ``jobs`` lookups
+    run at once (see :func:`iter_lookups`). Returns the words that still failed.
+    """
+    if console is None:
+        console = Console(stderr=True)
+    journal = journal_path(output)
+    done = read_journal(journal)
+    todo = [w for w in dict.fromkeys(words) if done.get(w) != OK]
+    skipped = len(dict.fromkeys(words)) - len(todo)
+    if skipped:
+        console.print(f"[dim]Resuming: {skipped} word(s) already done, {len(todo)} to go[/dim]")
+
+    with open(output, "a", encoding="utf-8") as out, open(journal, "a", encoding="utf-8") as jf:
+        out_console = Console(file=out, no_color=True, width=100)
+
+        def emit(result: WordResult) -> None:
+            if json_output:
+                out.write(json.dumps(result.to_dict()) + "\n")
+            else:
+                format_result(result, brief=brief, console=out_console, sections=sections)
+            out.flush()
+
+        def record(word: str, state: str) -> None:
+            jf.write(f"{state}\t{word}\n")
+            jf.flush()
+
+        failed = _run_pass(todo, lookup, emit, record, console, "Looking up", False, prefetch, jobs)
+        if failed:
+            retry = functools.partial(lookup, no_cache=True)
+            failed = _run_pass(failed, retry, emit, record, console, "Retrying", True, None, jobs)
+
+    if failed:
+        console.print(f"[red]{len(failed)} word(s) failed:[/red] {', '.join(failed[:20])}"
+                      + (" ..." if len(failed) > 20 else ""))
+    return failed
+
+
+def _run_pass(
+    words: list[str],
+    lookup: Callable[[str], WordResult],
+    emit: Callable[[WordResult], None],
+    record: Callable[[str, str], None],
+    console: Console,
+    label: str,
+    final: bool,
+    prefetch: Callable[[list[str]], None] | None = None,
+    jobs: int = 1,
+) -> list[str]:
+    failed: list[str] = []
+    start = time.monotonic()
+    with Progress(
+        TextColumn(f"[bold]{label}[/bold]"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TextColumn("[dim]{task.fields[rate]} words/s  {task.fields[failed]} failed[/dim]"),
+        TimeRemainingColumn(),
+        console=console,
+        transient=False,
+    ) as progress:
+        task = progress.add_task(label, total=len(words), rate="-", failed=0)
+        for i, (word, result) in enumerate(iter_lookups(words, lookup, jobs, prefetch), 1):
+            if isinstance(result, Exception) or _failed(result):
+                failed.append(word)
+                # Only the retry pass settles a failure; first-pass failures stay pending
+                if final:
+                    record(word, FAILED)
+            else:
+                emit(result)
+                record(word, OK)
+            elapsed = time.monotonic() - start
+            progress.update(
+                task, advance=1, failed=len(failed),
+                rate=f"{i / elapsed:.1f}" if elapsed > 0 else "-",
+            )
+    return failed
@@ -1,15 +1,148 @@
-"""JSON disk cache with 30-day TTL."""
+"""Cache backends: JSON disk cache with 30-day TTL, memory, and layered stacks."""
 
+import gzip
 import hashlib
 import json
+import os
+import re
+import threading
 import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable
 from pathlib import Path
 
 DEFAULT_CACHE_DIR = Path.home() / ".cache" / "vocab"
 TTL_SECONDS = 30 * 24 * 3600  # 30 days
 
+SNAPSHOT_MAGIC = "vocab-cache-snapshot 1"
+_KEY_RE = re.compile(r"[0-9a-f]{16}")
 
-class DiskCache:
+
+class CacheBackend(ABC):
+    """Interface shared by all cache backends.
+
+    Subclasses implement get/set/clear; network backends override the batch
+    methods to pipeline reads and buffer writes until :meth:`flush`.
+    """
+
+    @abstractmethod
+    def get(self, word: str) -> dict | None:
+        """Return the cached payload for word, or None."""
+
+    @abstractmethod
+    def set(self, word: str, payload: dict) -> None:
+        """Store payload for word."""
+
+    @abstractmethod
+    def clear(self) -> int:
+        """Remove all cached entries. Returns number of entries removed."""
+
+    def get_many(self, words: Iterable[str]) -> dict[str, dict]:
+        """Return payloads for the words that are cached, keyed by word."""
+        found = {}
+        for word in words:
+            payload = self.get(word)
+            if payload is not None:
+                found[word] = payload
+        return found
+
+    def set_many(self, items: dict[str, dict]) -> None:
+        for word, payload in items.items():
+            self.set(word, payload)
+
+    def flush(self) -> None:
+        """Write out any buffered entries."""
+
+    def close(self) -> None:
+        self.flush()
+
+
+class MemoryCache(CacheBackend):
+    """Thread-safe in-process LRU with the same TTL as the disk cache."""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, word: str) -> dict | None:
+        key = word.lower()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[0] > TTL_SECONDS:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, word: str, payload: dict) -> None:
+        key = word.lower()
+        with self._lock:
+            self._data[key] = (time.time(), payload)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._data)
+            self._data.clear()
+        return count
+
+
+class LayeredCache(CacheBackend):
+    """Stack of backends, fastest first. Hits in a lower layer fill the ones above."""
+
+    def __init__(self, layers: list[CacheBackend]):
+        self.layers = layers
+
+    def get(self, word: str) -> dict | None:
+        for i, layer in enumerate(self.layers):
+            payload = layer.get(word)
+            if payload is not None:
+                for upper in self.layers[:i]:
+                    upper.set(word, payload)
+                return payload
+        return None
+
+    def get_many(self, words: Iterable[str]) -> dict[str, dict]:
+        remaining = list(dict.fromkeys(words))
+        found: dict[str, dict] = {}
+        for i, layer in enumerate(self.layers):
+            if not remaining:
+                break
+            hits = layer.get_many(remaining)
+            if hits:
+                for upper in self.layers[:i]:
+                    upper.set_many(hits)
+                found.update(hits)
+                remaining = [w for w in remaining if w not in hits]
+        return found
+
+    def set(self, word: str, payload: dict) -> None:
+        for layer in self.layers:
+            layer.set(word, payload)
+
+    def set_many(self, items: dict[str, dict]) -> None:
+        for layer in self.layers:
+            layer.set_many(items)
+
+    def clear(self) -> int:
+        return sum(layer.clear() for layer in self.layers)
+
+    def flush(self) -> None:
+        for layer in self.layers:
+            layer.flush()
+
+    def close(self) -> None:
+        for layer in self.layers:
+            layer.close()
+
+
+class DiskCache(CacheBackend):
     def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR):
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -45,3 +178,131 @@ class DiskCache:
             path.write_text(json.dumps({"_ts": time.time(), "payload": payload}))
         except OSError:
             pass
+
+    def export(self, dest: Path) -> int:
+        """Stream all live entries into a gzip snapshot. Returns number of entries.
+
+        Each line is ``key<TAB>timestamp<TAB>entry-json``; the last line carries a
+        SHA-256 over all entry lines so a truncated or corrupted copy is rejected.
+        """
+        digest = hashlib.sha256()
+        count = 0
+        now = time.time()
+        tmp = dest.with_name(dest.name + ".tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as out:
+            out.write(SNAPSHOT_MAGIC + "\n")
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        with open(entry.path, encoding="utf-8") as f:
+                            raw = f.read().strip()
+                        ts = json.loads(raw).get("_ts", 0)
+                    except (json.JSONDecodeError, OSError, AttributeError):
+                        continue
+                    if now - ts > TTL_SECONDS:
+                        continue
+                    line = f"{entry.name[:-5]}\t{ts!r}\t{raw}\n"
+                    digest.update(line.encode())
+                    out.write(line)
+                    count += 1
+            out.write(f"#sha256 {digest.hexdigest()} {count}\n")
+        tmp.replace(dest)
+        return count
+
+    def import_snapshot(self, src: Path) -> tuple[int, int]:
+        """Merge a snapshot into this cache, newest timestamp wins.
+
+        The checksum is verified in a first streaming pass, so nothing is written
+        from a damaged file. Returns (entries written, entries skipped).
+        """
+        _verify_snapshot(src)
+        written = skipped = 0
+        now = time.time()
+        for key, ts, raw in _snapshot_entries(src):
+            if now - ts > TTL_SECONDS:
+                skipped += 1
+                continue
+            path = self.cache_dir / f"{key}.json"
+            try:
+                with open(path, encoding="utf-8") as f:
+                    local_ts = json.loads(f.read()).get("_ts", 0)
+            except (json.JSONDecodeError, OSError, AttributeError):
+                local_ts = None
+            if local_ts is not None and local_ts >= ts:
+                skipped += 1
+                continue
+            try:
+                path.write_text(raw)
+            except OSError:
+                skipped += 1
+                continue
+            written += 1
+        return written, skipped
+
+
+def _snapshot_lines(src: Path):
+    with gzip.open(src, "rt", encoding="utf-8") as f:
+        if f.readline().rstrip("\n") != SNAPSHOT_MAGIC:
+            raise ValueError(f"{src} is not a vocab cache snapshot")
+        yield from f
+
+
+def _verify_snapshot(src: Path) -> None:
+    """Raise ValueError unless the trailing checksum matches the entry lines."""
+    digest = hashlib.sha256()
+    count = 0
+    trailer = None
+    for line in _snapshot_lines(src):
+        if trailer is not None:
+            raise ValueError(f"{src}: data after checksum line")
+        if line.startswith("#sha256 "):
+            trailer = line.split()
+            continue
+        # Keys become file names; never trust them to be path-safe
+        if not _KEY_RE.fullmatch(line.split("\t", 1)[0]):
+            raise ValueError(f"{src}: invalid cache key on line {count + 2}")
+        digest.update(line.encode())
+        count += 1
+    if trailer is None:
+        raise ValueError(f"{src}: snapshot is truncated (no checksum line)")
+    if len(trailer) != 3 or trailer[1] != digest.hexdigest() or trailer[2] != str(count):
+        raise ValueError(f"{src}: snapshot checksum mismatch")
+
+
+def _snapshot_entries(src: Path):
+    """Yield (key, timestamp, raw entry json) from a verified snapshot."""
+    for line in _snapshot_lines(src):
+        if line.startswith("#sha256 "):
+            break
+        key, ts, raw = line.rstrip("\n").split("\t", 2)
+        yield key, float(ts), raw
+
+
+def open_cache(spec: str | None = None, cache_dir: Path | None = None) -> CacheBackend:
+    """Build a backend from comma-separated URLs, fastest layer first.
+
+    ``memory://`` is an in-process LRU, ``disk://`` (or ``disk:///path``) the
+    JSON disk cache, and ``redis://host:port/db`` or ``http://host:port`` a
+    shared network cache. Without a spec this is the disk cache in cache_dir.
+    """
+    if not spec:
+        return DiskCache(cache_dir or DEFAULT_CACHE_DIR)
+    layers: list[CacheBackend] = []
+    for url in (u.strip() for u in spec.split(",")):
+        if not url:
+            continue
+        scheme, _, rest = url.partition("://")
+        if scheme == "memory":
+            layers.append(MemoryCache())
+        elif scheme == "disk":
+            layers.append(DiskCache(Path(rest) if rest else cache_dir or DEFAULT_CACHE_DIR))
+        elif scheme in ("redis", "http", "https"):
+            from vocab.netcache import open_network_cache
+            layers.append(open_network_cache(url))
+        else:
+            raise ValueError(f"unsupported cache URL {url!r}")
+    if not layers:
+        raise ValueError("empty cache spec")
+    return layers[0] if len(layers) == 1 else LayeredCache(layers)
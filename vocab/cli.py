@@ -4,21 +4,25 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
 from pathlib import Path
 
 from rich.console import Console
 
-from vocab.cache import DiskCache
-from vocab.core import lookup_word
+from vocab.cache import DiskCache, LayeredCache, open_cache
+from vocab.core import WORDNET_FIELDS, WordResult, fields_for, lookup_word
 from vocab.formatter import format_result
-from vocab.sources.wordnet import ensure_data
 
 
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(
         prog="vocab",
         description="Look up words: definitions, frequency, etymology, synonyms, and more.",
+        epilog=(
+            "Run 'vocab daemon' to keep data loaded between invocations, or "
+            "'vocab cache export|import FILE' to share a warmed cache."
+        ),
     )
     p.add_argument("words", nargs="*", help="Words to look up")
     p.add_argument("-f", "--file", type=Path, help="Read words from file")
@@ -30,21 +34,139 @@ def build_parser() -> argparse.ArgumentParser:
         help="Show only specific sections",
     )
     p.add_argument("--offline", action="store_true", help="Skip API calls")
+    p.add_argument(
+        "--deadline", type=float, metavar="SECONDS",
+        help="Cap each lookup's latency; sections still loading are marked missing. "
+             "The CLI exits without waiting for them; a running daemon keeps and caches them",
+    )
     p.add_argument("--no-cache", action="store_true", help="Bypass disk cache")
     p.add_argument("--no-color", action="store_true", help="Disable colors")
     p.add_argument("--cache-dir", type=Path, help="Custom cache directory")
+    p.add_argument(
+        "--cache", metavar="URLS", default=os.environ.get("VOCAB_CACHE"),
+        help="Comma-separated cache backends, fastest first, e.g. "
+             "memory://,disk://,redis://host:6379 or http://host:8737 (default: $VOCAB_CACHE or disk)",
+    )
+    p.add_argument(
+        "--complete-infix", action="store_true",
+        help="Interactive mode: also complete words containing the typed text",
+    )
+    p.add_argument(
+        "--complete-fuzzy", action="store_true",
+        help="Interactive mode: also complete words one typo away from the typed text",
+    )
+    p.add_argument("--no-daemon", action="store_true", help="Do not forward lookups to a running daemon")
+    p.add_argument(
+        "-w", "--workers", type=int, metavar="N",
+        help="Parse in N worker processes and run lookups concurrently (0 = one per CPU)",
+    )
+    p.add_argument(
+        "-o", "--output", type=Path,
+        help="Write results to a file as a resumable batch job (progress kept in OUTPUT.journal)",
+    )
+    return p
+
+
+def build_cache_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="vocab cache",
+        description=(
+            "Export or import a snapshot of the lookup cache, or precompute the "
+            "etymology root-word index (build-ety), or serve the cache over HTTP "
+            "as a shared tier for other hosts (serve)."
+        ),
+    )
+    p.add_argument("action", choices=["export", "import", "build-ety", "serve"])
+    p.add_argument("snapshot", type=Path, nargs="?", help="Snapshot file (gzip)")
+    p.add_argument("--cache-dir", type=Path, help="Custom cache directory")
+    p.add_argument("--cache", metavar="URLS", help="Backends to serve (serve only; default: disk)")
+    p.add_argument("--host", default="127.0.0.1", help="Address to listen on (serve only)")
+    p.add_argument("--port", type=int, default=8737, help="Port to listen on (serve only)")
     return p
 
 
+def cache_main(argv: list[str]) -> None:
+    parser = build_cache_parser()
+    args = parser.parse_args(argv)
+    console = Console(stderr=True)
+    if args.action == "build-ety":
+        from vocab.sources import etymology
+        from vocab.sources.wordnet import all_lemmas
+        path = etymology.index_path(args.cache_dir)
+        console.print(f"[dim]Building etymology index at {path}...[/dim]")
+        try:
+            counts = etymology.build_index(all_lemmas(), path)
+        except ImportError:
+            console.print("[red]Error:[/red] the ety package is required (pip install vocab[etymology])")
+            sys.exit(1)
+        console.print(
+            f"[dim]Indexed {sum(counts.values())} words: {counts['found']} with roots, "
+            f"{counts['miss']} without, {counts['error']} failed[/dim]"
+        )
+        if counts["error"]:
+            console.print(
+                f"[yellow]{counts['error']} word(s) will show no root words; "
+                "rerun build-ety to retry them.[/yellow]"
+            )
+        return
+    if args.action == "serve":
+        from vocab.netcache import CacheServer
+        try:
+            backend = open_cache(args.cache, args.cache_dir)
+            server = CacheServer((args.host, args.port), backend)
+        except (OSError, ValueError) as e:
+            console.print(f"[red]Error:[/red] {e}")
+            sys.exit(1)
+        console.print(f"[dim]Serving cache on http://{args.host}:{args.port}[/dim]")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            backend.close()
+        return
+    if args.snapshot is None:
+        parser.error(f"{args.action} requires a snapshot file")
+    cache = DiskCache(args.cache_dir or DiskCache().cache_dir)
+    try:
+        if args.action == "export":
+            count = cache.export(args.snapshot)
+            console.print(f"[dim]Exported {count} entries to {args.snapshot}[/dim]")
+        else:
+            written, skipped = cache.import_snapshot(args.snapshot)
+            console.print(f"[dim]Imported {written} entries ({skipped} older or expired skipped)[/dim]")
+    except (OSError, EOFError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+
 def main() -> None:
-    parser = build_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    if argv[:1] == ["daemon"]:
+        from vocab.daemon import main as daemon_main
+        daemon_main(argv[1:])
+        return
+    if argv[:1] == ["cache"]:
+        cache_main(argv[1:])
+        return
 
-    # Ensure WordNet data is available
-    ensure_data()
+    parser = build_parser()
+    args = parser.parse_args(argv)
 
     console = Console(no_color=args.no_color)
-    cache = None if args.no_cache else DiskCache(args.cache_dir or DiskCache().cache_dir)
+    try:
+        cache = None if args.no_cache else open_cache(args.cache, args.cache_dir)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+    # The etymology index lives next to the cache it was built for
+    ety_index = None
+    if args.cache_dir:
+        from vocab.sources import etymology
+        ety_index = etymology.index_path(args.cache_dir)
+        etymology.use_index(ety_index)
 
     # Collect words from all sources
     words: list[str] = list(args.words)
@@ -61,6 +183,8 @@ def main() -> None:
 
     # No words provided → interactive mode
     if not words:
+        from vocab.sources.wordnet import ensure_data
+        ensure_data()
         from vocab.interactive import run_interactive
         run_interactive(
             offline=args.offline,
@@ -69,22 +193,113 @@ def main() -> None:
             cache_dir=args.cache_dir,
             brief=args.brief,
             sections=args.sections,
+            deadline=args.deadline,
+            cache_url=args.cache,
+            complete_infix=args.complete_infix,
+            complete_fuzzy=args.complete_fuzzy,
         )
         return
 
-    # Direct lookup mode
-    for word in words:
-        word = word.strip().lower()
-        if not word:
-            continue
-        result = lookup_word(
+    # Forward to a running daemon unless this run needs its own cache
+    client = None
+    if not args.no_daemon and not args.cache_dir and not args.cache and args.workers is None:
+        from vocab.daemon import connect
+        client = connect()
+    fields = fields_for(brief=args.brief, sections=args.sections, json_output=args.json_output)
+    # Sections that need no WordNet (e.g. -s freq) never load or download it
+    data_ready = not fields & WORDNET_FIELDS
+
+    def lookup(word: str, no_cache: bool = False) -> WordResult:
+        nonlocal data_ready
+        no_cache = no_cache or args.no_cache
+        if client:
+            data = client.lookup(
+                word, offline=args.offline, no_cache=no_cache, fields=fields,
+                deadline=args.deadline,
+            )
+            if data is not None:
+                return WordResult.from_dict(data)
+        if not data_ready:
+            # Ensure WordNet data is available
+            from vocab.sources.wordnet import ensure_data
+            ensure_data()
+            data_ready = True
+        return lookup_word(
             word,
             offline=args.offline,
-            cache=cache if not args.no_cache else None,
-            no_cache=args.no_cache,
-            sections=args.sections,
+            cache=cache if not no_cache else None,
+            no_cache=no_cache,
+            fields=fields,
+            deadline=args.deadline,
         )
-        if args.json_output:
-            print(json.dumps(result.to_dict(), indent=2))
-        else:
-            format_result(result, brief=args.brief, console=console)
+
+    words = [w for w in (w.strip().lower() for w in words) if w]
+
+    from vocab import workers
+
+    jobs = 1
+    if args.workers is not None:
+        if not data_ready:
+            # Download WordNet once here rather than racing in every worker
+            from vocab.sources.wordnet import ensure_data
+            ensure_data()
+            data_ready = True
+        n = args.workers or os.cpu_count() or 1
+        workers.start(n, ety_index=ety_index)
+        # Enough lookups in flight to keep every worker busy while others wait on the network
+        jobs = 4 * n
+
+    def close() -> None:
+        if client:
+            client.close()
+        if cache:
+            cache.close()
+        workers.shutdown()
+
+    def prefetch(chunk: list[str]) -> None:
+        if client:
+            return
+        roots = "root_words" in fields
+        hits = {}
+        # One pipelined read per chunk fills the fast layers from the shared tier
+        if cache is not None and (roots or isinstance(cache, LayeredCache)):
+            hits = cache.get_many(chunk)
+        if roots:
+            # Root chains for the words the cache cannot answer, one batch per chunk
+            workers.prefetch_roots([
+                w for w in chunk if "root_words" not in hits.get(w, {}).get("fetched", ())
+            ])
+
+    # Batch job mode
+    if args.output:
+        from vocab.batch import journal_path, run_batch
+        try:
+            failed = run_batch(
+                words, args.output, lookup,
+                json_output=args.json_output, brief=args.brief, sections=args.sections,
+                console=Console(stderr=True, no_color=args.no_color),
+                prefetch=prefetch,
+                jobs=jobs,
+            )
+        except KeyboardInterrupt:
+            console.print(
+                f"\n[dim]Interrupted. Progress is saved in {journal_path(args.output)}; "
+                "rerun the same command to resume.[/dim]"
+            )
+            sys.exit(130)
+        finally:
+            close()
+        sys.exit(1 if failed else 0)
+
+    # Direct lookup mode
+    from vocab.batch import iter_lookups
+    try:
+        for word, result in iter_lookups(words, lookup, jobs, prefetch):
+            if isinstance(result, Exception):
+                raise result
+            if args.json_output:
+                print(json.dumps(result.to_dict(), indent=2))
+            else:
+                format_result(result, brief=args.brief, console=console, sections=args.sections)
+    finally:
+        close()
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import bisect
 import difflib
+import heapq
+import threading
+import time
+from collections.abc import Callable, Iterable
 
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.document import Document
@@ -10,18 +15,195 @@ from prompt_toolkit.document import Document
 
 COMMANDS = ["/clear", "/clear-cache", "/clear-history", "/exit", "/file", "/help", "/quit"]
 
+MAX_COMPLETIONS = 20
+KEYSTROKE_BUDGET = 0.010  # seconds per complete() call; see benchmarks/bench_completion.py
+_ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+
+class CompletionIndex:
+    """Frequency-ranked prefix index over a fixed vocabulary.
+
+    Words are kept in one sorted array. Every prefix whose match range is
+    larger than ``leaf_size`` gets a precomputed table of its ``k`` most
+    frequent completions; any other prefix matches at most ``leaf_size``
+    words, so a query never scans more than that regardless of vocabulary
+    size. An n-gram posting index for infix matching is built on first use.
+    """
+
+    def __init__(
+        self,
+        words: Iterable[str],
+        scores: Callable[[list[str]], list[float]] | None = None,
+        k: int = MAX_COMPLETIONS,
+        leaf_size: int = 64,
+    ) -> None:
+        self.k = k
+        self.leaf_size = leaf_size
+        self._words: list[str] = sorted(set(words))
+        weights = scores(self._words) if scores else [0.0] * len(self._words)
+        # rank[i] is word i's position in (most frequent first, then alphabetical) order
+        by_rank = sorted(range(len(self._words)), key=lambda i: (-weights[i], self._words[i]))
+        self._rank: list[int] = [0] * len(self._words)
+        for r, i in enumerate(by_rank):
+            self._rank[i] = r
+        self._tables: dict[str, list[int]] = {}
+        self._grams: dict[str, list[int]] | None = None
+        if self._words:
+            self._build(0, len(self._words), 0)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def _build(self, lo: int, hi: int, depth: int) -> list[int]:
+        """Fill top-k tables for words[lo:hi], which share a prefix of length depth."""
+        words, rank = self._words, self._rank
+        if hi - lo <= self.leaf_size:
+            return heapq.nsmallest(self.k, range(lo, hi), key=rank.__getitem__)
+        prefix = words[lo][:depth]
+        candidates: list[int] = []
+        i = lo
+        # The prefix itself (if it is a word) sorts first in its range
+        while i < hi and len(words[i]) == depth:
+            candidates.append(i)
+            i += 1
+        while i < hi:
+            j = bisect.bisect_left(words, prefix + chr(ord(words[i][depth]) + 1), i, hi)
+            candidates.extend(self._build(i, j, depth + 1))
+            i = j
+        top = heapq.nsmallest(self.k, candidates, key=rank.__getitem__)
+        self._tables[prefix] = top
+        return top
+
+    def _prefix_ids(self, prefix: str) -> list[int]:
+        table = self._tables.get(prefix)
+        if table is not None:
+            return table
+        # No table means at most leaf_size words share this prefix
+        words = self._words
+        lo = bisect.bisect_left(words, prefix)
+        hi = min(lo + self.leaf_size, len(words))
+        # Matches are contiguous in sorted order, so stop at the first non-match
+        ids = []
+        for i in range(lo, hi):
+            if not words[i].startswith(prefix):
+                break
+            ids.append(i)
+        return heapq.nsmallest(self.k, ids, key=self._rank.__getitem__)
+
+    def prefix(self, text: str) -> list[str]:
+        """Return the k most frequent words starting with text."""
+        return [self._words[i] for i in self._prefix_ids(text)]
+
+    def _gram_index(self) -> dict[str, list[int]]:
+        if self._grams is None:
+            grams: dict[str, list[int]] = {}
+            words = self._words
+            for i in sorted(range(len(words)), key=self._rank.__getitem__):
+                w = words[i]
+                for g in {w[j:j + 3] for j in range(len(w) - 2)}:
+                    grams.setdefault(g, []).append(i)
+            self._grams = grams
+        return self._grams
+
+    def infix(self, text: str, limit: int, deadline: float | None = None) -> list[str]:
+        """Return up to limit frequent words containing text but not starting with it."""
+        if len(text) < 3:
+            return []
+        grams = self._gram_index()
+        keys = {text[j:j + 3] for j in range(len(text) - 2)}
+        # Walk the shortest posting list; it is already in rank order
+        postings = min((grams.get(g, []) for g in keys), key=len)
+        out: list[str] = []
+        for n, i in enumerate(postings):
+            if deadline is not None and n % 256 == 0 and time.perf_counter() > deadline:
+                break
+            w = self._words[i]
+            if text in w and not w.startswith(text):
+                out.append(w)
+                if len(out) >= limit:
+                    break
+        return out
+
+    def fuzzy(self, text: str, limit: int, deadline: float | None = None) -> list[str]:
+        """Return up to limit frequent words whose prefix is one edit away from text."""
+        if len(text) < 3:
+            return []
+        variants: set[str] = set()
+        for j in range(len(text) + 1):
+            head, tail = text[:j], text[j:]
+            if tail:
+                variants.add(head + tail[1:])
+                if len(tail) > 1:
+                    variants.add(head + tail[1] + tail[0] + tail[2:])
+            for c in _ALPHABET:
+                variants.add(head + c + tail)
+                if tail:
+                    variants.add(head + c + tail[1:])
+        variants.discard(text)
+        candidates: set[int] = set()
+        for v in variants:
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+            candidates.update(self._prefix_ids(v))
+        ranked = heapq.nsmallest(limit * 2, candidates, key=self._rank.__getitem__)
+        return [self._words[i] for i in ranked if not self._words[i].startswith(text)][:limit]
+
+    def complete(
+        self,
+        text: str,
+        infix: bool = False,
+        fuzzy: bool = False,
+        budget: float | None = KEYSTROKE_BUDGET,
+    ) -> list[str]:
+        """Prefix matches first, then infix and fuzzy matches while budget allows.
+
+        The prefix stage is bounded by ``leaf_size`` and always runs; the
+        optional stages stop once ``budget`` seconds of the whole call are spent.
+        """
+        deadline = time.perf_counter() + budget if budget is not None else None
+        results = self.prefix(text)
+        if infix and len(results) < self.k:
+            results += self.infix(text, self.k - len(results), deadline)
+        if fuzzy and len(results) < self.k:
+            seen = set(results)
+            extra = self.fuzzy(text, self.k - len(results), deadline)
+            results += [w for w in extra if w not in seen]
+        return results
+
 
 class WordCompleter(Completer):
-    """Tab-completion from WordNet lemma list + slash commands."""
+    """Tab-completion from WordNet lemma list + slash commands.
+
+    Building the index takes about a second, far over the keystroke budget,
+    so :meth:`start` builds it in a background thread; until it is ready only
+    slash commands complete.
+    """
 
-    def __init__(self) -> None:
-        self._words: list[str] | None = None
+    def __init__(self, infix: bool = False, fuzzy: bool = False) -> None:
+        self.infix = infix
+        self.fuzzy = fuzzy
+        self._index: CompletionIndex | None = None
+        self._thread: threading.Thread | None = None
 
-    def _load(self) -> list[str]:
-        if self._words is None:
-            from vocab.sources.wordnet import all_lemmas
-            self._words = sorted(all_lemmas())
-        return self._words
+    def start(self) -> None:
+        """Start building the index, if not already started."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._build, name="vocab-completion-index", daemon=True,
+            )
+            self._thread.start()
+
+    def _build(self) -> None:
+        from vocab.sources.frequency import bulk_frequency
+        from vocab.sources.wordnet import all_lemmas
+        try:
+            index = CompletionIndex(all_lemmas(), scores=bulk_frequency)
+            if self.infix:
+                index._gram_index()
+        except Exception:
+            # No WordNet data: word completion stays off, the shell still works
+            return
+        self._index = index
 
     def get_completions(self, document: Document, complete_event):
         text = document.text_before_cursor.strip().lower()
@@ -35,20 +217,14 @@ class WordCompleter(Completer):
                     yield Completion(cmd, start_position=-len(text))
             return
 
+        index = self._index
+        if index is None:
+            self.start()
+            return
         if len(text) < 2:
             return
-        words = self._load()
-        # Binary search for prefix range
-        import bisect
-        lo = bisect.bisect_left(words, text)
-        count = 0
-        for i in range(lo, len(words)):
-            if not words[i].startswith(text):
-                break
-            yield Completion(words[i], start_position=-len(text))
-            count += 1
-            if count >= 20:
-                break
+        for word in index.complete(text, infix=self.infix, fuzzy=self.fuzzy):
+            yield Completion(word, start_position=-len(text))
 
 
 def suggest_correction(word: str, word_set: set[str] | None = None) -> list[str]:
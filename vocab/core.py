@@ -2,11 +2,50 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import copy
 import dataclasses
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, wait
 from dataclasses import dataclass, field
 
-from vocab.sources import dictionary_api, wiktionary, wordnet, etymology, frequency
-from vocab.cache import DiskCache
+from vocab.cache import CacheBackend
+
+# Fields each output mode needs. Lookups run only the sources that produce them.
+ALL_FIELDS = frozenset({
+    "phonetic", "definitions", "synonyms", "antonyms", "frequency",
+    "etymology_text", "root_words", "related_words", "base_word", "brief_def",
+})
+BRIEF_FIELDS = frozenset({"brief_def"})
+# Fields that may need WordNet (definitions only as a fallback for the API)
+WORDNET_FIELDS = frozenset({"brief_def", "definitions", "synonyms", "antonyms", "base_word"})
+SECTION_FIELDS = {
+    "def": frozenset({"phonetic", "definitions"}),
+    "freq": frozenset({"frequency"}),
+    "syn": frozenset({"synonyms", "antonyms"}),
+    "ety": frozenset({"etymology_text", "related_words", "root_words"}),
+}
+
+
+def fields_for(
+    brief: bool = False,
+    sections: list[str] | None = None,
+    json_output: bool = False,
+) -> frozenset[str]:
+    """Return the WordResult fields an output mode displays.
+
+    This mirrors :func:`vocab.formatter.format_result`, which in brief mode
+    prints only the gloss and with sections prints only those sections, so
+    e.g. ``-s freq`` never touches WordNet. JSON output has no brief form, so
+    it gets every field unless sections narrow it.
+    """
+    if brief and not json_output:
+        return BRIEF_FIELDS
+    if sections:
+        return frozenset().union(*(SECTION_FIELDS[s] for s in sections))
+    return ALL_FIELDS
 
 
 @dataclass
@@ -24,9 +63,16 @@ class WordResult:
     base_result: WordResult | None = None
 
     brief_def: str = ""
+    # Fields that have been computed; everything else is unset, not empty
+    fetched: set[str] = field(default_factory=set)
+    # Requested sections whose sources failed or did not finish before the deadline
+    missing: list[str] = field(default_factory=list)
+    # Sources that raised (network down, server error) rather than finding nothing
+    failed: list[str] = field(default_factory=list)
 
     def to_dict(self) -> dict:
         d = dataclasses.asdict(self)
+        d["fetched"] = sorted(self.fetched)
         if self.base_result:
             d["base_result"] = self.base_result.to_dict()
         else:
@@ -35,7 +81,10 @@ class WordResult:
 
     @staticmethod
     def from_dict(d: dict) -> WordResult:
+        # Payloads may be live cache entries (MemoryCache); never mutate or alias them
+        d = copy.deepcopy(d)
         br = d.pop("base_result", None)
+        d["fetched"] = set(d.get("fetched", ()))
         result = WordResult(**d)
         if br:
             result.base_result = WordResult.from_dict(br)
@@ -69,82 +118,258 @@ def _truncate(text: str, max_words: int = 6) -> str:
 def lookup_word(
     word: str,
     offline: bool = False,
-    cache: DiskCache | None = None,
+    cache: CacheBackend | None = None,
     no_cache: bool = False,
     sections: list[str] | None = None,
+    fields: frozenset[str] | set[str] | None = None,
+    deadline: float | None = None,
 ) -> WordResult:
-    """Orchestrate lookups across all sources."""
-    # Check cache
+    """Orchestrate lookups across the sources needed for ``fields``.
+
+    ``fields`` defaults to what ``sections`` displays (see :func:`fields_for`).
+    A cached result is returned as-is when it already holds every requested
+    field; otherwise only the missing fields are fetched and merged into it.
+
+    ``deadline`` caps the total seconds spent waiting on network sources,
+    counted from after the sources are loaded. Sections whose source is still
+    running are listed in ``result.missing``; the source keeps running and
+    caches its payload for the next lookup, unless the process exits first.
+    Sources that raise are listed in ``result.failed`` and their sections in
+    ``result.missing``; they are retried by the next lookup of the word.
+    """
+    want = frozenset(fields) if fields is not None else fields_for(sections=sections)
+
+    result = None
     if cache and not no_cache:
         cached = cache.get(word)
         if cached:
-            return WordResult.from_dict(cached)
+            result = WordResult.from_dict(cached)
+            # Both lists describe the lookup that wrote the entry, not this one
+            _clear_failed(result)
+            if _has_fields(result, want):
+                _set_missing(result, want)
+                return result
+    if result is None:
+        result = WordResult(word=word)
+
+    # A cold process spends a second or more importing NLTK and wordfreq; that
+    # must not use up the deadline before the network sources even start
+    from vocab.sources import dictionary_api, etymology, frequency, wiktionary, wordnet  # noqa: F401
+    until = time.monotonic() + deadline if deadline is not None else None
 
-    result = WordResult(word=word)
-    want = set(sections) if sections else None
+    _fill(result, want - result.fetched, want, offline, cache, no_cache, until)
+    _set_missing(result, want)
+
+    # Cache result
+    if cache and not no_cache:
+        cache.set(word, result.to_dict())
+
+    return result
+
+
+def _fill(
+    result: WordResult,
+    need: frozenset[str],
+    want: frozenset[str],
+    offline: bool,
+    cache: CacheBackend | None,
+    no_cache: bool,
+    until: float | None = None,
+) -> None:
+    """Run only the sources that produce the fields in need.
+
+    Network sources run concurrently in the background pool while the offline
+    sources run here, or in worker processes when :mod:`vocab.workers` is
+    started; fields from a network source or worker stage that misses
+    ``until`` are left out of ``result.fetched``.
+    """
+    # Imported here so daemon clients can build WordResults without loading NLTK
+    from vocab.sources import dictionary_api, wiktionary, wordnet, etymology, frequency
+    from vocab import workers
+
+    word = result.word
+    pool = workers.get_pool()
+    source_cache = cache if not no_cache else None
+    api_fields = {"phonetic", "definitions", "synonyms", "antonyms"}
+    wiki_fields = {"etymology_text", "related_words"}
+
+    api_future = wiki_future = None
+    if not offline and need & api_fields:
+        api_future = _submit("dictionary_api", word, dictionary_api.lookup, source_cache)
+    if not offline and need & wiki_fields:
+        wiki_lookup = workers.wiktionary_lookup if pool else wiktionary.lookup
+        wiki_future = _submit("wiktionary", word, wiki_lookup, source_cache)
+
+    # Batch runs compute root chains a chunk at a time ahead of the lookups
+    roots = workers.prefetched_roots(word) if "root_words" in need else None
+
+    # With a process pool, WordNet and ety run in a worker alongside the network
+    stage = None
+    stage_need = need - {"root_words"} if roots is not None else need
+    if pool and stage_need & workers.OFFLINE_FIELDS:
+        stage = pool.submit(workers.offline_stage, word, stage_need)
+
+    # Fields left out of fetched: their source is late or failed
+    unfilled: set[str] = set()
+
+    def remaining() -> float | None:
+        return max(0.0, until - time.monotonic()) if until is not None else None
+
+    def worker_result(future: Future, key, fields: set[str], default):
+        try:
+            return future.result(remaining())[key]
+        except concurrent.futures.TimeoutError:
+            unfilled.update(fields)
+            return default
+
+    def staged(key: str, compute: Callable, fields: set[str], default=None):
+        return worker_result(stage, key, fields, default) if stage else compute()
 
     # Frequency (always offline, fast)
-    if not want or "freq" in want:
+    if "frequency" in need:
         result.frequency = frequency.lookup(word)
 
+    # Root words from ety library
+    if "root_words" in need:
+        if roots is not None:
+            result.root_words = worker_result(roots, word, {"root_words"}, [])
+        else:
+            result.root_words = staged(
+                "roots", lambda: etymology.lookup(word), {"root_words"}, [],
+            )
+
+    pending = [f for f in (api_future, wiki_future) if f is not None]
+    late = wait(pending, timeout=remaining()).not_done if pending else set()
+    for future in late:
+        _cache_when_done(future, source_cache)
+    if api_future in late:
+        unfilled |= api_fields
+    if wiki_future in late:
+        unfilled |= wiki_fields
+
+    def payload(future: Future | None, name: str, fields: set[str]) -> dict | None:
+        if future is None or future in late:
+            return None
+        try:
+            return future.result()[1]
+        except Exception:
+            # Left out of fetched, so the next lookup asks the source again
+            result.failed.append(name)
+            unfilled.update(fields)
+            return None
+
     # Definitions: try API first, fall back to WordNet
-    api_data = None
-    if not offline and (not want or want & {"def", "syn"}):
-        api_data = dictionary_api.lookup(word)
+    api_data = payload(api_future, "dictionary_api", api_fields)
 
+    # WordNet supplies the brief gloss, merged synonyms, and fallback definitions
     wn_data = None
-    if not api_data or offline:
-        wn_data = wordnet.lookup(word)
+    if need & {"brief_def", "synonyms", "antonyms"} or ("definitions" in need and not api_data):
+        wn_fields = {"brief_def", "synonyms", "antonyms"} | (set() if api_data else {"definitions"})
+        wn_data = staged("wn", lambda: wordnet.lookup(word), wn_fields)
 
-    # Brief definition from WordNet (always, since it's a different phrasing)
-    if not wn_data:
-        wn_data = wordnet.lookup(word)
-    if wn_data:
+    if "brief_def" in need and wn_data:
         result.brief_def = wn_data.get("brief", "")
 
-    if api_data and (not want or "def" in want):
+    if "phonetic" in need and api_data:
         result.phonetic = api_data.get("phonetic", "")
-        result.definitions = api_data.get("definitions", {})
-    elif wn_data and (not want or "def" in want):
-        result.definitions = wn_data.get("definitions", {})
+    if "definitions" in need:
+        if api_data:
+            result.definitions = api_data.get("definitions", {})
+        elif wn_data:
+            result.definitions = wn_data.get("definitions", {})
 
     # Synonyms/antonyms: merge API + WordNet
-    if not want or "syn" in want:
+    if need & {"synonyms", "antonyms"}:
         syns: set[str] = set()
         ants: set[str] = set()
-        if api_data:
-            syns.update(api_data.get("synonyms", []))
-            ants.update(api_data.get("antonyms", []))
-        if wn_data or (not api_data and not offline):
-            if not wn_data:
-                wn_data = wordnet.lookup(word)
-            if wn_data:
-                syns.update(wn_data.get("synonyms", []))
-                ants.update(wn_data.get("antonyms", []))
+        for data in (api_data, wn_data):
+            if data:
+                syns.update(data.get("synonyms", []))
+                ants.update(data.get("antonyms", []))
         result.synonyms = sorted(syns)
         result.antonyms = sorted(ants)
 
     # Etymology from Wiktionary
-    if not offline and (not want or "ety" in want):
-        wiki_data = wiktionary.lookup(word)
-        if wiki_data:
-            result.etymology_text = wiki_data.get("etymology", "")
-            result.related_words = wiki_data.get("related", [])
-
-    # Root words from ety library
-    if not want or "ety" in want:
-        result.root_words = etymology.lookup(word)
+    wiki_data = payload(wiki_future, "wiktionary", wiki_fields)
+    if wiki_data:
+        result.etymology_text = wiki_data.get("etymology", "")
+        result.related_words = wiki_data.get("related", [])
 
     # Lemmatization: if this is an inflected form, also look up the base word
-    base = wordnet.lemmatize(word)
-    if base and base != word:
-        result.base_word = base
+    if "base_word" in need:
+        base = staged("base", lambda: wordnet.lemmatize(word), {"base_word"})
+        if base and base != word:
+            result.base_word = base
+    if "base_word" in want and result.base_word and not _has_fields(result.base_result, want):
         result.base_result = lookup_word(
-            base, offline=offline, cache=cache, no_cache=no_cache, sections=sections,
+            result.base_word, offline=offline, cache=cache, no_cache=no_cache, fields=want,
+            deadline=remaining(),
         )
 
-    # Cache result
-    if cache and not no_cache:
-        cache.set(word, result.to_dict())
+    result.fetched |= need - unfilled
 
-    return result
+
+def _submit(
+    name: str, word: str, fn: Callable[[str], dict | None], cache: CacheBackend | None,
+) -> Future:
+    """Run a network source in a background thread, serving its cached payload if any.
+
+    The future resolves to (cache key, payload). The thread is daemonic: a
+    CLI run with ``--deadline`` exits as soon as its output is printed rather
+    than waiting for late sources, whose payloads are then only cached by
+    long-lived processes (the daemon, the interactive shell).
+    """
+    key = f"source:{name}:{word}"
+    future: Future = Future()
+    if cache:
+        payload = cache.get(key)
+        if payload:
+            future.set_result((None, payload))
+            return future
+
+    def run() -> None:
+        try:
+            future.set_result((key, fn(word)))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name=f"vocab-{name}", daemon=True).start()
+    return future
+
+
+def _cache_when_done(future: Future, cache: CacheBackend | None) -> None:
+    """Store a late source's payload so the next lookup of the word is complete."""
+    if not cache:
+        return
+
+    def store(f: Future) -> None:
+        if f.exception() is None:
+            key, payload = f.result()
+            if key and payload:
+                cache.set(key, payload)
+
+    future.add_done_callback(store)
+
+
+def _set_missing(result: WordResult, want: frozenset[str]) -> None:
+    """List the sections of want that result (and its base form) lack."""
+    while result is not None:
+        result.missing = [
+            name for name, f in SECTION_FIELDS.items() if f & want and not f & want <= result.fetched
+        ]
+        result = result.base_result
+
+
+def _clear_failed(result: WordResult | None) -> None:
+    while result is not None:
+        result.failed = []
+        result = result.base_result
+
+
+def _has_fields(result: WordResult | None, want: frozenset[str]) -> bool:
+    """True if result (and its base form, when wanted) already holds every field."""
+    if result is None or not want <= result.fetched:
+        return False
+    if "base_word" in want and result.base_word:
+        return _has_fields(result.base_result, want)
+    return True
@@ -0,0 +1,225 @@
+"""Opt-in lookup daemon over a Unix socket, plus the client the CLI forwards to."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+from pathlib import Path
+
+from vocab.cache import CacheBackend, DiskCache, MemoryCache, open_cache
+
+MEMORY_CACHE_SIZE = 4096
+CONNECT_TIMEOUT = 0.2  # seconds; a missing or dead daemon must not slow the CLI down
+READ_TIMEOUT = 30.0  # seconds to wait for a reply when the request has no deadline
+DEADLINE_SLACK = 1.0  # seconds on top of a request's deadline
+
+
+def default_socket_path() -> Path:
+    """Socket location: $VOCAB_SOCKET, else $XDG_RUNTIME_DIR, else the cache dir."""
+    env = os.environ.get("VOCAB_SOCKET")
+    if env:
+        return Path(env)
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return Path(runtime) / "vocab.sock"
+    return DiskCache().cache_dir / "daemon.sock"
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """One JSON request per line, one JSON response per line."""
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                response = {"ok": True, "result": self.server.dispatch(json.loads(line))}
+            except Exception as e:
+                response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class VocabServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Keeps WordNet, the lemmatizer and HTTP sessions loaded between requests."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, cache: CacheBackend | None = None) -> None:
+        self.socket_path = socket_path
+        self.cache = cache
+        # Serialized WordResults per (word, offline, fields) request
+        self.memory = MemoryCache(MEMORY_CACHE_SIZE)
+        super().__init__(str(socket_path), _Handler)
+
+    def warm(self) -> None:
+        """Load everything a cold process would otherwise load on first lookup."""
+        # The HTTP sources are imported for their connection-pooling sessions
+        from vocab.sources import dictionary_api, etymology, frequency, wiktionary, wordnet  # noqa: F401
+
+        wordnet.ensure_data()
+        wordnet.lookup("warm")
+        wordnet.lemmatize("warmed")
+        frequency.lookup("warm")
+        etymology.lookup("warm")
+
+    def dispatch(self, request: dict) -> dict | None:
+        op = request.get("op", "lookup")
+        if op == "ping":
+            return {"pid": os.getpid()}
+        if op != "lookup":
+            raise ValueError(f"unknown op {op!r}")
+
+        from vocab.core import lookup_word
+
+        word = request["word"]
+        offline = bool(request.get("offline"))
+        no_cache = bool(request.get("no_cache"))
+        fields = request.get("fields")
+        fields = frozenset(fields) if fields is not None else None
+        deadline = request.get("deadline")
+        key = "\t".join((
+            word, "offline" if offline else "", "*" if fields is None else ",".join(sorted(fields)),
+        ))
+        if not no_cache:
+            hit = self.memory.get(key)
+            if hit is not None:
+                return hit
+        result = lookup_word(
+            word,
+            offline=offline,
+            cache=None if no_cache else self.cache,
+            no_cache=no_cache,
+            fields=fields,
+            deadline=deadline,
+        ).to_dict()
+        # Partial results stay out of memory so the next request can complete them
+        if not no_cache and not result["missing"]:
+            self.memory.set(key, result)
+        return result
+
+
+class DaemonClient:
+    """Connection to a running daemon. Use :func:`connect` to create one."""
+
+    def __init__(self, sock: socket.socket) -> None:
+        self._sock = sock
+        self._file = sock.makefile("rwb")
+
+    def _call(self, request: dict, timeout: float = READ_TIMEOUT) -> dict | None:
+        """Send one request; None means the caller should look up locally."""
+        if self._file is None:
+            return None
+        try:
+            self._sock.settimeout(timeout)
+            self._file.write(json.dumps(request).encode() + b"\n")
+            self._file.flush()
+            response = json.loads(self._file.readline())
+            if not isinstance(response, dict):
+                raise ValueError("malformed response")
+        except (OSError, ValueError):
+            # Timed out, closed or garbled: the stream is out of step, stop using it
+            self.close()
+            return None
+        return response.get("result") if response.get("ok") else None
+
+    def lookup(
+        self,
+        word: str,
+        offline: bool = False,
+        no_cache: bool = False,
+        fields: frozenset[str] | set[str] | None = None,
+        deadline: float | None = None,
+    ) -> dict | None:
+        """Return a serialized WordResult, or None if the daemon could not answer."""
+        return self._call({
+            "op": "lookup",
+            "word": word,
+            "offline": offline,
+            "no_cache": no_cache,
+            "fields": sorted(fields) if fields is not None else None,
+            "deadline": deadline,
+        }, timeout=deadline + DEADLINE_SLACK if deadline is not None else READ_TIMEOUT)
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        try:
+            self._file.close()
+            self._sock.close()
+        except OSError:
+            pass
+        self._file = None
+
+    def __enter__(self) -> DaemonClient:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def connect(socket_path: Path | None = None) -> DaemonClient | None:
+    """Connect to a running daemon, or return None if none is listening."""
+    path = socket_path or default_socket_path()
+    if not path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+    return DaemonClient(sock)
+
+
+def serve(socket_path: Path, cache: CacheBackend | None = None) -> None:
+    """Run the daemon in the foreground until interrupted."""
+    client = connect(socket_path)
+    if client is not None:
+        client.close()
+        raise RuntimeError(f"a vocab daemon is already listening on {socket_path}")
+    # Stale socket left behind by a daemon that did not shut down cleanly
+    socket_path.unlink(missing_ok=True)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    server = VocabServer(socket_path, cache)
+    try:
+        os.chmod(socket_path, 0o600)
+        server.warm()
+        print(f"vocab daemon listening on {socket_path}", file=sys.stderr)
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point for ``vocab daemon``."""
+    p = argparse.ArgumentParser(
+        prog="vocab daemon",
+        description="Keep vocab's data loaded and serve lookups over a Unix socket.",
+    )
+    p.add_argument("--socket", type=Path, help="Socket path (default: $VOCAB_SOCKET or runtime dir)")
+    p.add_argument("--no-cache", action="store_true", help="Bypass disk cache")
+    p.add_argument("--cache-dir", type=Path, help="Custom cache directory")
+    p.add_argument("--cache", metavar="URLS", help="Cache backends, fastest first (see vocab --help)")
+    args = p.parse_args(argv)
+
+    if args.cache_dir:
+        from vocab.sources import etymology
+        etymology.use_index(etymology.index_path(args.cache_dir))
+    cache = None
+    try:
+        cache = None if args.no_cache else open_cache(args.cache, args.cache_dir)
+        serve(args.socket or default_socket_path(), cache)
+    except (RuntimeError, ValueError) as e:
+        print(f"vocab daemon: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if cache:
+            cache.close()
@@ -7,19 +7,33 @@ from rich.panel import Panel
 from vocab.core import WordResult
 
 
-def format_result(result: WordResult, brief: bool = False, console: Console | None = None) -> None:
-    """Print a formatted word result to the terminal."""
+def format_result(
+    result: WordResult,
+    brief: bool = False,
+    console: Console | None = None,
+    sections: list[str] | None = None,
+) -> None:
+    """Print a formatted word result to the terminal.
+
+    With ``sections``, only those sections are printed: no gloss line and no
+    base form block (see :data:`vocab.core.SECTION_FIELDS`).
+    """
     if console is None:
         console = Console()
 
+    def show(section: str) -> bool:
+        return not sections or section in sections
+
     # Word header + phonetic
     header = Text(result.word, style="bold white")
-    if result.phonetic:
+    if result.phonetic and show("def"):
         header.append(f"  {result.phonetic}", style="dim")
     console.print(header)
+    if result.missing:
+        console.print(Text(f"Incomplete (timed out or unavailable): {', '.join(result.missing)}", style="dim"))
 
     # Brief definition
-    brief_def = result.brief_definition()
+    brief_def = result.brief_definition() if not sections else ""
     if brief_def:
         console.print(Text(brief_def, style="italic cyan"))
 
@@ -27,7 +41,7 @@ def format_result(result: WordResult, brief: bool = False, console: Console | No
         return
 
     # Full definitions by part of speech
-    if result.definitions:
+    if result.definitions and show("def"):
         console.print()
         for pos, defs in result.definitions.items():
             console.print(Text(pos, style="bold yellow"))
@@ -35,47 +49,47 @@ def format_result(result: WordResult, brief: bool = False, console: Console | No
                 console.print(f"  {i}. {d}")
 
     # Frequency
-    if result.frequency:
+    if result.frequency and show("freq"):
         console.print()
         f = result.frequency
         console.print(Text("Frequency", style="bold yellow"))
         console.print(f"  {f['per_million']}/million  ·  zipf {f['zipf']}  ·  {f['label']}")
 
     # Etymology
-    if result.etymology_text:
+    if result.etymology_text and show("ety"):
         console.print()
         console.print(Text("Etymology", style="bold yellow"))
         for section in result.etymology_text.split("\n\n"):
             console.print(f"  {section}")
 
     # Root words
-    if result.root_words:
+    if result.root_words and show("ety"):
         console.print()
         console.print(Text("Root words", style="bold yellow"))
         console.print(f"  {' → '.join(result.root_words)}")
 
     # Related/derived words
-    if result.related_words:
+    if result.related_words and show("ety"):
         console.print()
         console.print(Text("Related words", style="bold yellow"))
         console.print(f"  {', '.join(result.related_words)}")
 
     # Synonyms
-    if result.synonyms:
+    if result.synonyms and show("syn"):
         console.print()
         console.print(Text("Synonyms", style="bold yellow"))
         syn_text = Text(f"  {', '.join(result.synonyms[:15])}", style="green")
         console.print(syn_text)
 
     # Antonyms
-    if result.antonyms:
+    if result.antonyms and show("syn"):
         console.print()
         console.print(Text("Antonyms", style="bold yellow"))
         ant_text = Text(f"  {', '.join(result.antonyms[:15])}", style="red")
         console.print(ant_text)
 
     # Base word (lemmatized form)
-    if result.base_word and result.base_result:
+    if result.base_word and result.base_result and not sections:
         console.print()
         console.print(Text(f"Base form: {result.base_word}", style="bold magenta"))
         format_result(result.base_result, brief=brief, console=console)
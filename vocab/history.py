@@ -0,0 +1,151 @@
+"""Bounded, deduplicated search history with a prefix index for autosuggest."""
+
+from __future__ import annotations
+
+import datetime
+from collections.abc import Iterable
+from pathlib import Path
+
+from prompt_toolkit.auto_suggest import AutoSuggest, Suggestion
+from prompt_toolkit.buffer import Buffer
+from prompt_toolkit.document import Document
+from prompt_toolkit.history import History
+
+MAX_ENTRIES = 1000
+MAX_PREFIX = 32  # longer inputs fall back to a scan of the (bounded) entries
+
+
+class VocabHistory(History):
+    """File-backed history that keeps about ``max_entries`` unique entries.
+
+    The file uses prompt_toolkit's ``FileHistory`` format, so existing history
+    files are read as-is. New entries are appended; once the file holds twice
+    as many records as live entries it is rewritten without duplicates. The
+    file is only read on first use, and every prefix of every entry maps to
+    the newest entry starting with it, so suggestions are a dict lookup.
+    """
+
+    def __init__(self, path: Path, max_entries: int = MAX_ENTRIES) -> None:
+        super().__init__()
+        self.path = path
+        self.max_entries = max_entries
+        self._entries: list[str] | None = None  # oldest first, unique
+        self._prefixes: dict[str, str] = {}
+        self._records = 0  # entries on disk, duplicates included
+
+    def _read_file(self) -> list[str]:
+        strings: list[str] = []
+        lines: list[str] = []
+        try:
+            with open(self.path, encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    if line.startswith("+"):
+                        lines.append(line[1:])
+                    elif lines:
+                        strings.append("".join(lines)[:-1])
+                        lines = []
+        except FileNotFoundError:
+            pass
+        if lines:
+            strings.append("".join(lines)[:-1])
+        return strings
+
+    def _load(self) -> list[str]:
+        if self._entries is None:
+            strings = self._read_file()
+            self._records = len(strings)
+            # Keep the last occurrence of each entry, in order
+            self._entries = list(dict.fromkeys(reversed(strings)))[::-1][-self.max_entries:]
+            self._reindex()
+            if self._records > 2 * len(self._entries):
+                self._compact()
+        return self._entries
+
+    def _index(self, string: str) -> None:
+        for i in range(1, min(len(string), MAX_PREFIX) + 1):
+            self._prefixes[string[:i]] = string
+
+    def _reindex(self) -> None:
+        self._prefixes = {}
+        for string in self._entries or ():
+            self._index(string)
+
+    def _compact(self) -> None:
+        """Rewrite the file with only the live entries."""
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                for string in self._entries or ():
+                    f.write(_record(string))
+            tmp.replace(self.path)
+            self._records = len(self._entries or ())
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def load_history_strings(self) -> Iterable[str]:
+        return reversed(self._load())
+
+    def append_string(self, string: str) -> None:
+        if string in self._loaded_strings:
+            self._loaded_strings.remove(string)
+        super().append_string(string)
+        del self._loaded_strings[self.max_entries:]
+
+    def store_string(self, string: str) -> None:
+        entries = self._load()
+        if string in entries:
+            entries.remove(string)
+        entries.append(string)
+        # Trim in batches so the index is rebuilt rarely, not on every entry
+        if len(entries) > self.max_entries + self.max_entries // 4:
+            del entries[:len(entries) - self.max_entries]
+            self._reindex()
+        else:
+            self._index(string)
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(_record(string))
+            self._records += 1
+        except OSError:
+            return
+        if self._records > 2 * self.max_entries:
+            self._compact()
+
+    def suggest(self, text: str) -> str | None:
+        """Return the newest entry that starts with text, if any."""
+        self._load()
+        match = self._prefixes.get(text[:MAX_PREFIX])
+        if match is None or match.startswith(text):
+            return match
+        for string in reversed(self._entries or ()):
+            if string.startswith(text):
+                return string
+        return None
+
+    def clear(self) -> None:
+        """Forget all entries and truncate the history file."""
+        self.path.unlink(missing_ok=True)
+        self._entries = []
+        self._prefixes = {}
+        self._records = 0
+        self._loaded_strings = []
+
+
+def _record(string: str) -> str:
+    lines = "".join(f"+{line}\n" for line in string.split("\n"))
+    return f"\n# {datetime.datetime.now()}\n{lines}"
+
+
+class AutoSuggestFromIndex(AutoSuggest):
+    """Fish-style ghost text from a :class:`VocabHistory` prefix index."""
+
+    def get_suggestion(self, buffer: Buffer, document: Document) -> Suggestion | None:
+        history = buffer.history
+        # Consider only the last line for the suggestion.
+        text = document.text.rsplit("\n", 1)[-1]
+        if not text.strip() or not isinstance(history, VocabHistory):
+            return None
+        match = history.suggest(text)
+        if match and len(match) > len(text):
+            return Suggestion(match[len(text):])
+        return None
@@ -5,14 +5,13 @@ from __future__ import annotations
 from pathlib import Path
 
 from prompt_toolkit import PromptSession
-from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
-from prompt_toolkit.history import FileHistory
 from rich.console import Console
 
-from vocab.cache import DiskCache
+from vocab.cache import open_cache
 from vocab.completer import WordCompleter, suggest_correction
-from vocab.core import lookup_word
+from vocab.core import fields_for, lookup_word
 from vocab.formatter import format_result
+from vocab.history import AutoSuggestFromIndex, VocabHistory
 from vocab.sources.wordnet import all_lemmas
 
 HISTORY_DIR = Path.home() / ".local" / "share" / "vocab"
@@ -26,17 +25,24 @@ def run_interactive(
     cache_dir: Path | None = None,
     brief: bool = False,
     sections: list[str] | None = None,
+    deadline: float | None = None,
+    cache_url: str | None = None,
+    complete_infix: bool = False,
+    complete_fuzzy: bool = False,
 ) -> None:
     """Run the interactive REPL."""
     HISTORY_DIR.mkdir(parents=True, exist_ok=True)
     console = Console(no_color=no_color)
-    cache = DiskCache(cache_dir) if cache_dir else (None if no_cache else DiskCache())
-    completer = WordCompleter()
+    cache = open_cache(cache_url, cache_dir) if cache_dir or not no_cache else None
+    completer = WordCompleter(infix=complete_infix, fuzzy=complete_fuzzy)
+    completer.start()
+    fields = fields_for(brief=brief, sections=sections)
     lemmas: set[str] | None = None
 
+    history = VocabHistory(HISTORY_FILE)
     session: PromptSession = PromptSession(
-        history=FileHistory(str(HISTORY_FILE)),
-        auto_suggest=AutoSuggestFromHistory(),
+        history=history,
+        auto_suggest=AutoSuggestFromIndex(),
         completer=completer,
     )
 
@@ -68,8 +74,7 @@ def run_interactive(
             continue
         if text == "/clear-history":
             try:
-                HISTORY_FILE.unlink(missing_ok=True)
-                session.history = FileHistory(str(HISTORY_FILE))
+                history.clear()
                 console.print("[dim]History cleared.[/dim]")
             except OSError as e:
                 console.print(f"[red]Error clearing history:[/red] {e}")
@@ -111,9 +116,10 @@ def run_interactive(
                     offline=offline,
                     cache=cache if not no_cache else None,
                     no_cache=no_cache,
-                    sections=sections,
+                    fields=fields,
+                    deadline=deadline,
                 )
-                format_result(r, brief=brief, console=console)
+                format_result(r, brief=brief, console=console, sections=sections)
             continue
 
         word = text.split()[0].lower()
@@ -145,6 +151,10 @@ def run_interactive(
             offline=offline,
             cache=cache if not no_cache else None,
             no_cache=no_cache,
-            sections=sections,
+            fields=fields,
+            deadline=deadline,
         )
-        format_result(result, brief=brief, console=console)
+        format_result(result, brief=brief, console=console, sections=sections)
+
+    if cache:
+        cache.close()
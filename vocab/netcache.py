@@ -0,0 +1,365 @@
+"""Shared network cache tier: Redis-protocol and HTTP key-value backends.
+
+Both backends buffer writes and send them in one round trip per batch, read
+many keys in one pipelined request, and stop talking to an unreachable server
+for a while instead of slowing every lookup down. ``vocab cache serve`` runs
+the matching HTTP server in front of any local backend.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import socket
+import threading
+import time
+from abc import abstractmethod
+from collections.abc import Iterable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, unquote, urlsplit
+
+from vocab.cache import TTL_SECONDS, CacheBackend
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 64
+TIMEOUT = 2.0  # seconds per network round trip
+RETRY_AFTER = 30.0  # seconds to skip a server after a failure
+MISS_TTL = 60.0  # seconds to trust that a key is absent
+MAX_MISSES = 8192  # remembered misses before expired ones are dropped
+
+
+class NetworkError(Exception):
+    """The shared cache could not be reached or answered with an error."""
+
+
+class _NetworkCache(CacheBackend):
+    """Write buffering, batching and failure backoff shared by network backends.
+
+    ``_lock`` only guards the buffers; round trips run outside it so one slow
+    request does not stall every other lookup thread. Keys a read found
+    absent are remembered for ``MISS_TTL`` seconds, so the per-word reads that
+    follow a batch prefetch do not ask the server again.
+    """
+
+    def __init__(self, batch_size: int = BATCH_SIZE) -> None:
+        self.batch_size = batch_size
+        self._pending: dict[str, dict] = {}
+        self._flushing: dict[str, dict] = {}  # sent but not yet acknowledged
+        self._misses: dict[str, float] = {}  # key -> monotonic expiry
+        self._lock = threading.Lock()
+        self._down_until = 0.0
+
+    @abstractmethod
+    def _read_batch(self, keys: list[str]) -> dict[str, dict]:
+        """Return the payloads stored for keys, omitting absent ones."""
+
+    @abstractmethod
+    def _write_batch(self, items: dict[str, dict]) -> None:
+        """Store every payload in items."""
+
+    def _call(self, fn, arg):
+        if time.monotonic() < self._down_until:
+            return None
+        try:
+            return fn(arg)
+        except NetworkError as e:
+            logger.warning("shared cache unavailable, retrying in %.0fs: %s", RETRY_AFTER, e)
+            self._down_until = time.monotonic() + RETRY_AFTER
+            return None
+
+    def _buffered(self, key: str) -> dict | None:
+        payload = self._pending.get(key)
+        return payload if payload is not None else self._flushing.get(key)
+
+    def get(self, word: str) -> dict | None:
+        return self.get_many([word]).get(word)
+
+    def get_many(self, words: Iterable[str]) -> dict[str, dict]:
+        keys = {word.lower(): word for word in words}
+        found: dict[str, dict] = {}
+        now = time.monotonic()
+        with self._lock:
+            for key in list(keys):
+                # Read-your-writes for entries still waiting in the buffer
+                payload = self._buffered(key)
+                if payload is not None:
+                    found[keys.pop(key)] = payload
+                elif self._misses.get(key, 0.0) > now:
+                    del keys[key]
+        if not keys:
+            return found
+        hits = self._call(self._read_batch, list(keys))
+        if hits is None:
+            return found
+        with self._lock:
+            if len(self._misses) > MAX_MISSES:
+                self._misses = {k: t for k, t in self._misses.items() if t > now}
+            for key in keys:
+                if key not in hits and self._buffered(key) is None:
+                    self._misses[key] = now + MISS_TTL
+        for key, payload in hits.items():
+            found[keys[key]] = payload
+        return found
+
+    def set(self, word: str, payload: dict) -> None:
+        self.set_many({word: payload})
+
+    def set_many(self, items: dict[str, dict]) -> None:
+        with self._lock:
+            for word, payload in items.items():
+                key = word.lower()
+                self._pending[key] = payload
+                self._misses.pop(key, None)
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            items, self._pending = self._pending, {}
+            self._flushing.update(items)
+        if not items:
+            return
+        self._call(self._write_batch, items)
+        with self._lock:
+            for key, payload in items.items():
+                if self._flushing.get(key) is payload:
+                    del self._flushing[key]
+
+    def clear(self) -> int:
+        # A shared cache is never wiped from one client; only drop unsent writes
+        with self._lock:
+            count = len(self._pending)
+            self._pending = {}
+            self._misses = {}
+        return count
+
+
+class RedisCache(_NetworkCache):
+    """Speaks enough RESP for GET/MGET/SET against Redis or a compatible server."""
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: str | None = None,
+        prefix: str = "vocab:",
+        batch_size: int = BATCH_SIZE,
+    ) -> None:
+        super().__init__(batch_size)
+        self.host, self.port, self.db, self.password = host, port, db, password
+        self.prefix = prefix
+        self._sock: socket.socket | None = None
+        self._file = None
+        # One connection: replies must be read in the order requests were sent
+        self._io_lock = threading.Lock()
+
+    def _connect(self) -> None:
+        self._sock = socket.create_connection((self.host, self.port), timeout=TIMEOUT)
+        self._file = self._sock.makefile("rb")
+        setup = []
+        if self.password:
+            setup.append(["AUTH", self.password])
+        if self.db:
+            setup.append(["SELECT", str(self.db)])
+        if setup:
+            try:
+                self._pipeline_locked(setup)
+            except NetworkError:
+                # Do not leave an unauthenticated connection behind for the next call
+                self._disconnect()
+                raise
+
+    def _disconnect(self) -> None:
+        if self._sock is not None:
+            try:
+                self._file.close()
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = self._file = None
+
+    def _pipeline(self, commands: list[list[str]]) -> list:
+        """Send all commands in one write, then read one reply per command."""
+        with self._io_lock:
+            return self._pipeline_locked(commands)
+
+    def _pipeline_locked(self, commands: list[list[str]]) -> list:
+        try:
+            if self._sock is None:
+                self._connect()
+            out = bytearray()
+            for args in commands:
+                out += b"*%d\r\n" % len(args)
+                for arg in args:
+                    data = arg.encode()
+                    out += b"$%d\r\n%s\r\n" % (len(data), data)
+            self._sock.sendall(out)
+            replies = [self._read_reply() for _ in commands]
+        except (OSError, ValueError) as e:
+            self._disconnect()
+            raise NetworkError(f"redis://{self.host}:{self.port}: {e}") from e
+        for reply in replies:
+            if isinstance(reply, _RedisError):
+                raise NetworkError(f"redis://{self.host}:{self.port}: {reply}")
+        return replies
+
+    def _read_reply(self):
+        line = self._file.readline()
+        if not line.endswith(b"\r\n"):
+            raise ValueError("connection closed")
+        kind, body = line[:1], line[1:-2]
+        if kind == b"+":
+            return body.decode()
+        if kind == b"-":
+            return _RedisError(body.decode())
+        if kind == b":":
+            return int(body)
+        if kind == b"$":
+            n = int(body)
+            if n < 0:
+                return None
+            data = self._file.read(n + 2)
+            return data[:-2]
+        if kind == b"*":
+            n = int(body)
+            return None if n < 0 else [self._read_reply() for _ in range(n)]
+        raise ValueError(f"unexpected reply {line!r}")
+
+    def _read_batch(self, keys: list[str]) -> dict[str, dict]:
+        values = self._pipeline([["MGET", *(self.prefix + k for k in keys)]])[0]
+        found = {}
+        for key, value in zip(keys, values):
+            if value is not None:
+                try:
+                    found[key] = json.loads(value)
+                except ValueError:
+                    continue
+        return found
+
+    def _write_batch(self, items: dict[str, dict]) -> None:
+        self._pipeline([
+            ["SET", self.prefix + key, json.dumps(payload), "EX", str(TTL_SECONDS)]
+            for key, payload in items.items()
+        ])
+
+    def close(self) -> None:
+        super().close()
+        with self._io_lock:
+            self._disconnect()
+
+
+class _RedisError(str):
+    pass
+
+
+class HttpCache(_NetworkCache):
+    """Client for the key-value API served by ``vocab cache serve``.
+
+    ``GET /<key>`` returns ``{"payload": ...}`` or 404, ``POST /_mget`` takes
+    ``{"keys": [...]}`` and returns ``{"entries": {key: payload}}``, and
+    ``POST /_mset`` stores ``{"entries": {key: payload}}``.
+    """
+
+    def __init__(self, base_url: str, batch_size: int = BATCH_SIZE) -> None:
+        import requests
+
+        super().__init__(batch_size)
+        self.base_url = base_url.rstrip("/")
+        self._requests = requests
+        self._session = requests.Session()
+
+    def _post(self, path: str, body: dict) -> dict:
+        try:
+            resp = self._session.post(f"{self.base_url}/{path}", json=body, timeout=TIMEOUT)
+            resp.raise_for_status()
+            return resp.json() if resp.content else {}
+        except (self._requests.RequestException, ValueError) as e:
+            raise NetworkError(f"{self.base_url}: {e}") from e
+
+    def _read_batch(self, keys: list[str]) -> dict[str, dict]:
+        if len(keys) == 1:
+            try:
+                resp = self._session.get(
+                    f"{self.base_url}/{quote(keys[0], safe='')}", timeout=TIMEOUT,
+                )
+                if resp.status_code == 404:
+                    return {}
+                resp.raise_for_status()
+                return {keys[0]: resp.json()["payload"]}
+            except (self._requests.RequestException, ValueError, KeyError) as e:
+                raise NetworkError(f"{self.base_url}: {e}") from e
+        return self._post("_mget", {"keys": keys}).get("entries", {})
+
+    def _write_batch(self, items: dict[str, dict]) -> None:
+        self._post("_mset", {"entries": items})
+
+
+def open_network_cache(url: str) -> CacheBackend:
+    """Create a network backend from a redis:// or http(s):// URL."""
+    parts = urlsplit(url)
+    if parts.scheme == "redis":
+        db = parts.path.strip("/")
+        backend: _NetworkCache = RedisCache(
+            host=parts.hostname or "localhost",
+            port=parts.port or 6379,
+            db=int(db) if db else 0,
+            password=unquote(parts.password) if parts.password else None,
+        )
+    elif parts.scheme in ("http", "https"):
+        backend = HttpCache(url)
+    else:
+        raise ValueError(f"unsupported network cache URL {url!r}")
+    # Buffered writes must not be lost when a short CLI run exits
+    atexit.register(backend.flush)
+    return backend
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: CacheServer
+
+    def _reply(self, status: int, body: dict | None = None) -> None:
+        data = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        payload = self.server.cache.get(unquote(self.path.lstrip("/")))
+        if payload is None:
+            self._reply(404)
+        else:
+            self._reply(200, {"payload": payload})
+
+    def do_POST(self) -> None:
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length))
+        except ValueError:
+            self._reply(400)
+            return
+        if self.path == "/_mget":
+            self._reply(200, {"entries": self.server.cache.get_many(body.get("keys", []))})
+        elif self.path == "/_mset":
+            self.server.cache.set_many(body.get("entries", {}))
+            self._reply(204)
+        else:
+            self._reply(404)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(format, *args)
+
+
+class CacheServer(ThreadingHTTPServer):
+    """HTTP key-value front end for a local backend, shared by many hosts."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], cache: CacheBackend) -> None:
+        self.cache = cache
+        super().__init__(address, _Handler)
@@ -4,18 +4,26 @@ import requests
 
 API_URL = "https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
 
+# Shared session so repeated lookups (batch runs, the daemon) reuse connections
+_session = requests.Session()
+
 
 def lookup(word: str, timeout: float = 5.0) -> dict | None:
-    """Return parsed dictionary data or None on failure."""
+    """Return parsed dictionary data, or None if the API has no entry for word.
+
+    Raises requests.RequestException when the API cannot be reached or
+    answers with an error, so callers can tell an outage from an unknown word.
+    """
+    resp = _session.get(API_URL.format(word=word), timeout=timeout)
+    if resp.status_code == 404:
+        return None
+    resp.raise_for_status()
     try:
-        resp = requests.get(API_URL.format(word=word), timeout=timeout)
-        if resp.status_code != 200:
-            return None
         entries = resp.json()
         if not isinstance(entries, list) or not entries:
             return None
         return _parse(entries)
-    except (requests.RequestException, ValueError, KeyError):
+    except (ValueError, KeyError):
         return None
 
 
@@ -1,11 +1,216 @@
-"""ety library wrapper for root word chains. Gracefully skipped if unavailable."""
+"""ety library wrapper for root word chains. Gracefully skipped if unavailable.
 
+Root chains can be precomputed for the whole vocabulary with
+``vocab cache build-ety``; lookups then read the memory-mapped index instead of
+walking the ety graph, and only words missing from it fall back to ety. The
+index lives in the cache directory; :func:`use_index` points lookups at
+another one.
+"""
 
-def lookup(word: str) -> list[str]:
-    """Return list of root/origin words, or empty list if ety unavailable."""
+from __future__ import annotations
+
+import logging
+import mmap
+import struct
+from collections.abc import Iterable
+from pathlib import Path
+
+from vocab.cache import DEFAULT_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "etymology.idx"
+INDEX_PATH = DEFAULT_CACHE_DIR / INDEX_NAME
+_MAGIC = b"VETY\x00\x00\x00\x01"
+_HEADER = struct.Struct("<8sI")
+_OFFSET = struct.Struct("<I")
+
+# Record status bytes: roots found, ety knows no origins, ety raised during build
+FOUND, MISS, ERROR = b"+", b"-", b"!"
+
+
+class RootIndex:
+    """Read-only, memory-mapped map of word -> root chain.
+
+    Layout: header (magic, count), count+1 offsets into the data area, then
+    records ``word \\t status \\t root \\x1f root ...`` sorted by UTF-8 word bytes.
+    """
+
+    def __init__(self, path: Path) -> None:
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not a vocab etymology index")
+        self._data = _HEADER.size + _OFFSET.size * (self._count + 1)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _record(self, i: int) -> bytes:
+        start = _OFFSET.unpack_from(self._mm, _HEADER.size + _OFFSET.size * i)[0]
+        end = _OFFSET.unpack_from(self._mm, _HEADER.size + _OFFSET.size * (i + 1))[0]
+        return self._mm[self._data + start:self._data + end]
+
+    def get_record(self, word: str) -> tuple[bytes, list[str]] | None:
+        """Return (status, roots) for word, or None if the index has no entry."""
+        key = word.encode()
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            rec = self._record(mid)
+            k, _, rest = rec.partition(b"\t")
+            if k == key:
+                status, _, roots = rest.partition(b"\t")
+                return status, roots.decode().split("\x1f") if roots else []
+            if k < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def get(self, word: str) -> list[str] | None:
+        """Return the indexed root chain (possibly empty), or None if not indexed."""
+        rec = self.get_record(word)
+        return rec[1] if rec is not None else None
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+_index_path = INDEX_PATH
+_index: RootIndex | None = None
+_index_checked = False
+_error_warned = False
+
+
+def index_path(cache_dir: Path | None = None) -> Path:
+    """Return the index location for a cache directory (default: the user cache)."""
+    return cache_dir / INDEX_NAME if cache_dir else INDEX_PATH
+
+
+def use_index(path: Path) -> None:
+    """Read root chains from the index at path from now on."""
+    global _index_path
+    if path != _index_path:
+        _reset_index()
+        _index_path = path
+
+
+def _reset_index() -> None:
+    global _index, _index_checked
+    if _index is not None:
+        _index.close()
+    _index, _index_checked = None, False
+
+
+def _load_index() -> RootIndex | None:
+    global _index, _index_checked
+    if not _index_checked:
+        _index_checked = True
+        try:
+            _index = RootIndex(_index_path)
+        except FileNotFoundError:
+            _index = None
+        except (OSError, ValueError, struct.error) as e:
+            logger.warning("ignoring unreadable etymology index %s: %s", _index_path, e)
+            _index = None
+    return _index
+
+
+def _walk(word: str) -> list[str]:
+    """Run the recursive ety walk. Raises ImportError if ety is not installed."""
+    import ety
+    origins = ety.origins(word, recursive=True)
+    return [str(o) for o in origins] if origins else []
+
+
+def _live_lookup(word: str) -> list[str]:
     try:
-        import ety
-        origins = ety.origins(word, recursive=True)
-        return [str(o) for o in origins] if origins else []
-    except Exception:
+        return _walk(word)
+    except ImportError:
+        return []
+    except Exception as e:
+        logger.warning("ety lookup failed for %r: %s", word, e)
         return []
+
+
+def _indexed(index: RootIndex | None, word: str) -> list[str] | None:
+    """Return the indexed root chain, or None if the word must be walked live."""
+    rec = index.get_record(word) if index is not None else None
+    if rec is None:
+        return None
+    status, roots = rec
+    if status == ERROR:
+        # Stored so lookups stay fast, but the chain is unknown rather than empty.
+        # Warn once per process; build-ety already reported how many failed.
+        global _error_warned
+        if not _error_warned:
+            _error_warned = True
+            logger.warning(
+                "some root chains (first: %r) failed when the etymology index was built; "
+                "rerun 'vocab cache build-ety' to retry them", word,
+            )
+        else:
+            logger.debug("ety failed for %r when the etymology index was built", word)
+    return roots
+
+
+def lookup(word: str) -> list[str]:
+    """Return list of root/origin words, or empty list if ety unavailable."""
+    roots = _indexed(_load_index(), word)
+    return roots if roots is not None else _live_lookup(word)
+
+
+def lookup_many(words: Iterable[str]) -> dict[str, list[str]]:
+    """Batch form of :func:`lookup`; only words missing from the index hit ety."""
+    index = _load_index()
+    results: dict[str, list[str]] = {}
+    # Sorted keys read the index front to back instead of jumping around the mmap
+    for word in sorted(set(words)):
+        roots = _indexed(index, word)
+        results[word] = roots if roots is not None else _live_lookup(word)
+    return results
+
+
+def build_index(words: Iterable[str], path: Path | None = None) -> dict[str, int]:
+    """Precompute root chains for words and write the index. Returns status counts.
+
+    Words ety knows nothing about are stored as explicit misses and words whose
+    walk raised are stored as errors, so neither falls back to ety at lookup time.
+    """
+    import ety  # noqa: F401  (fail fast with ImportError when ety is missing)
+
+    path = path or _index_path
+
+    records: list[bytes] = []
+    counts = {"found": 0, "miss": 0, "error": 0}
+    for word in sorted({w.encode() for w in words}):
+        w = word.decode()
+        try:
+            roots = _walk(w)
+            status = FOUND if roots else MISS
+        except Exception:
+            logger.debug("ety walk failed for %r", w, exc_info=True)
+            roots, status = [], ERROR
+        counts[{FOUND: "found", MISS: "miss", ERROR: "error"}[status]] += 1
+        roots_blob = "\x1f".join(r.replace("\x1f", " ").replace("\t", " ") for r in roots)
+        records.append(word + b"\t" + status + b"\t" + roots_blob.encode())
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, len(records)))
+        offset = 0
+        f.write(_OFFSET.pack(offset))
+        for rec in records:
+            offset += len(rec)
+            f.write(_OFFSET.pack(offset))
+        for rec in records:
+            f.write(rec)
+    tmp.replace(path)
+
+    if path == _index_path:
+        _reset_index()
+    return counts
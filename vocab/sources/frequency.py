@@ -1,6 +1,6 @@
 """Word frequency data via wordfreq library."""
 
-from wordfreq import zipf_frequency, word_frequency
+from wordfreq import get_frequency_dict, zipf_frequency, word_frequency
 
 
 def lookup(word: str, lang: str = "en") -> dict:
@@ -28,3 +28,14 @@ def lookup(word: str, lang: str = "en") -> dict:
         "percentage": round(freq * 100, 6),
         "label": label,
     }
+
+
+def bulk_frequency(words: list[str], lang: str = "en") -> list[float]:
+    """Return raw frequencies for many words at once, aligned with ``words``.
+
+    Reads wordfreq's frequency table directly instead of tokenizing each word,
+    which is what makes ranking the whole WordNet vocabulary affordable.
+    Multi-word lemmas missing from the table score 0.0.
+    """
+    table = get_frequency_dict(lang)
+    return [table.get(w, 0.0) for w in words]
@@ -6,23 +6,41 @@ from bs4 import BeautifulSoup, Tag
 WIKTIONARY_URL = "https://en.wiktionary.org/wiki/{word}"
 HEADERS = {"User-Agent": "vocab-cli/0.1 (https://github.com/vocab-cli; educational tool)"}
 
+_session = requests.Session()
+
 
 def lookup(word: str, timeout: float = 5.0) -> dict | None:
-    """Return etymology text and related/derived words, or None."""
+    """Return etymology text and related/derived words, or None if there is no page."""
+    html = fetch(word, timeout)
+    return parse(html) if html is not None else None
+
+
+def fetch(word: str, timeout: float = 5.0) -> str | None:
+    """Return the raw Wiktionary page HTML, or None if there is no page for word.
+
+    Raises requests.RequestException when Wiktionary cannot be reached or
+    answers with an error.
+    """
+    resp = _session.get(
+        WIKTIONARY_URL.format(word=word),
+        headers=HEADERS,
+        timeout=timeout,
+    )
+    if resp.status_code == 404:
+        return None
+    resp.raise_for_status()
+    return resp.text
+
+
+def parse(html: str) -> dict | None:
+    """Extract etymology and related words from page HTML (CPU-bound)."""
     try:
-        resp = requests.get(
-            WIKTIONARY_URL.format(word=word),
-            headers=HEADERS,
-            timeout=timeout,
-        )
-        if resp.status_code != 200:
-            return None
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(html, "html.parser")
         return {
             "etymology": _extract_etymology(soup),
             "related": _extract_related(soup),
         }
-    except (requests.RequestException, Exception):
+    except Exception:
         return None
 
 
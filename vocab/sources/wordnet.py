@@ -1,22 +1,38 @@
-"""NLTK WordNet source for offline definitions, synonyms, and antonyms."""
+"""NLTK WordNet source for offline definitions, synonyms, and antonyms.
+
+NLTK's corpus reader seeks and reads one shared file handle per data file
+whenever a synset is not cached yet, so concurrent callers (daemon request
+threads, the completion index build) can read each other's lines. Every
+function here holds ``_lock`` while it touches WordNet; the network sources
+stay concurrent.
+"""
+
+import threading
 
 from nltk.corpus import wordnet as wn
 from nltk.stem import WordNetLemmatizer
 
 _lemmatizer = WordNetLemmatizer()
+_lock = threading.RLock()
 
 
 def ensure_data() -> None:
     """Download WordNet data if not present."""
     import nltk
-    try:
-        wn.synsets("test")
-    except LookupError:
-        nltk.download("wordnet", quiet=True)
+    with _lock:
+        try:
+            wn.synsets("test")
+        except LookupError:
+            nltk.download("wordnet", quiet=True)
 
 
 def lookup(word: str) -> dict | None:
     """Return definitions, synonyms, and antonyms from WordNet."""
+    with _lock:
+        return _lookup(word)
+
+
+def _lookup(word: str) -> dict | None:
     synsets = wn.synsets(word)
     if not synsets:
         return None
@@ -77,11 +93,17 @@ def _shortest_gloss(synsets) -> str:
 def all_lemmas() -> set[str]:
     """Return all WordNet lemma names for autocomplete."""
     ensure_data()
-    return {l.replace("_", " ") for l in wn.all_lemma_names()}
+    with _lock:
+        return {l.replace("_", " ") for l in wn.all_lemma_names()}
 
 
 def lemmatize(word: str) -> str | None:
     """Return the base/lemma form if the word is inflected, or None if already base."""
+    with _lock:
+        return _lemmatize(word)
+
+
+def _lemmatize(word: str) -> str | None:
     bases: set[str] = set()
     for pos in ("n", "v", "a", "r"):
         lemma = _lemmatizer.lemmatize(word, pos)
@@ -0,0 +1,125 @@
+"""Optional process pool for the CPU-bound source stages.
+
+HTML parsing, WordNet synset walks and ety traversal are pure Python and hold
+the GIL, so threads cannot run them in parallel. With :func:`start`, lookups
+send those stages to worker processes that load WordNet once each; workers
+receive raw payloads (a word, a page of HTML) and return small parsed dicts.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+
+# Fields produced by offline_stage
+OFFLINE_FIELDS = frozenset({
+    "brief_def", "definitions", "synonyms", "antonyms", "root_words", "base_word",
+})
+
+PREFETCHED_ROOTS = 1024  # words whose prefetched root chains may wait unused
+
+_pool: ProcessPoolExecutor | None = None
+_roots: dict[str, Future] = {}
+
+
+def _init_worker(ety_index: Path | None = None) -> None:
+    """Load WordNet, the lemmatizer and the etymology index once per worker."""
+    from vocab.sources import etymology, wordnet
+
+    if ety_index is not None:
+        etymology.use_index(ety_index)
+    wordnet.ensure_data()
+    wordnet.lookup("warm")
+    wordnet.lemmatize("warmed")
+    etymology.lookup("warm")
+
+
+def start(workers: int | None = None, ety_index: Path | None = None) -> ProcessPoolExecutor:
+    """Start the shared pool (one worker per CPU by default) and return it.
+
+    ``ety_index`` is the etymology index the workers read (see
+    :func:`vocab.sources.etymology.use_index`).
+    """
+    global _pool
+    if _pool is None:
+        # spawn: the parent already runs source threads, which fork does not survive
+        _pool = ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count() or 1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(ety_index,),
+        )
+    return _pool
+
+
+def get_pool() -> ProcessPoolExecutor | None:
+    return _pool
+
+
+def shutdown() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
+
+
+def prefetch_roots(words: list[str]) -> None:
+    """Start computing root chains for a chunk of upcoming words.
+
+    The whole chunk goes through :func:`~vocab.sources.etymology.lookup_many`
+    in one call (one worker round trip with the pool, inline without it);
+    lookups then pick their chain up with :func:`prefetched_roots`.
+    """
+    from vocab.sources import etymology
+
+    words = [w for w in words if w not in _roots]
+    if not words:
+        return
+    if len(_roots) > PREFETCHED_ROOTS:
+        # Chains for words that were never looked up; drop them rather than grow
+        _roots.clear()
+    if _pool is not None:
+        future = _pool.submit(etymology.lookup_many, words)
+    else:
+        future = Future()
+        future.set_result(etymology.lookup_many(words))
+    for word in words:
+        _roots[word] = future
+
+
+def prefetched_roots(word: str) -> Future | None:
+    """Return a future of ``{word: roots, ...}`` if word was prefetched, once."""
+    return _roots.pop(word, None)
+
+
+def offline_stage(word: str, need: frozenset[str]) -> dict:
+    """Run the WordNet and ety work a lookup needs, in one round trip.
+
+    WordNet data is computed whenever any WordNet-backed field is needed; in
+    the inline path definitions only fall back to WordNet when the API fails,
+    but here the walk is cheap compared to a second round trip.
+    """
+    from vocab.sources import etymology, wordnet
+
+    out: dict = {"wn": None, "base": None, "roots": []}
+    if need & {"brief_def", "definitions", "synonyms", "antonyms"}:
+        out["wn"] = wordnet.lookup(word)
+    if "base_word" in need:
+        out["base"] = wordnet.lemmatize(word)
+    if "root_words" in need:
+        out["roots"] = etymology.lookup(word)
+    return out
+
+
+def wiktionary_lookup(word: str, timeout: float = 5.0) -> dict | None:
+    """Fetch in the calling thread, parse in a worker process."""
+    from vocab.sources import wiktionary
+
+    html = wiktionary.fetch(word, timeout)
+    if html is None:
+        return None
+    if _pool is None:
+        return wiktionary.parse(html)
+    return _pool.submit(wiktionary.parse, html).result()